@@ -3,17 +3,13 @@ from tkinter import ttk, filedialog, messagebox
 import cv2
 from pyzbar.pyzbar import decode
 from PIL import Image, ImageTk
-import openpyxl
+import numpy as np
 from datetime import datetime
-import gspread
-from oauth2client.service_account import ServiceAccountCredentials # For service account
-# If using OAuth2 for installed applications (more common for desktop apps):
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
 import os
+import time # Monotonic clock for pacing the webcam capture loop
+import csv # Append-only scan log; microseconds per row vs. rewriting the xlsx
 import threading # To prevent UI freezing during webcam scan
-import pandas as pd # For easier Excel/Sheet header checking
+import queue # Hands frames from the capture thread to the decode worker
 
 # --- Configuration ---
 APP_NAME = "QR Object Logger"
@@ -22,17 +18,52 @@ GSHEET_SCOPES = ['https://www.googleapis.com/auth/spreadsheets',
                  'https://www.googleapis.com/auth/drive.file'] # Drive scope for finding sheets by name
 GSHEET_CREDENTIALS_FILE = 'credentials.json' # Downloaded from Google Cloud Console
 GSHEET_TOKEN_FILE = 'token.json' # Will be created after first authorization
+GSHEET_FLUSH_DELAY_MS = 5000 # Buffer scans and push them in one batched API call
+EXCEL_SAVE_DELAY_MS = 2000 # Debounce workbook.save so rapid scans cost one rewrite
+
+# openpyxl and gspread cost hundreds of ms and tens of MB to import, but are
+# only needed once the user actually saves or authenticates. Import them on
+# first use so the window is interactive immediately.
+_openpyxl = None
+_gspread = None
+
+def _get_openpyxl():
+    global _openpyxl
+    if _openpyxl is None:
+        import openpyxl as _openpyxl
+    return _openpyxl
+
+def _get_gspread():
+    global _gspread
+    if _gspread is None:
+        import gspread as _gspread
+    return _gspread
 
 class QRScannerApp:
+    HEADERS = ("Object ID", "Name", "Timestamp") # Column order for Excel, CSV and Sheets
+
     def __init__(self, root):
         self.root = root
         self.root.title(APP_NAME)
         self.root.geometry("600x700")
 
         self.scanned_data = None
+        self.scanned_row = None # Same scan as an ordered tuple matching HEADERS
         self.excel_file_path = EXCEL_DEFAULT_FILENAME
+        # Workbook is loaded once and kept open; saves are debounced so each
+        # scan is an in-memory append instead of a full load+rewrite.
+        self._excel_workbook = None
+        self.excel_save_scheduled = False
         self.gspread_client = None
+        self.pending_gsheet_rows = [] # Rows waiting for the next batched Sheets flush
+        self.gsheet_flush_scheduled = False
+        # Resolved once per sheet name; opening the spreadsheet and probing
+        # headers costs 2-3 API calls that never change between scans.
+        self._gsheet_worksheet = None
+        self.qr_detector = cv2.QRCodeDetector() # OpenCV decoder, reused for every frame/file
+        self._frames_since_full_decode = 0 # Paces the full-frame fallback in _decode_frame
         self.gspread_sheet_name = tk.StringVar(value="My QR Scans") # Default Google Sheet name
+        self.gspread_sheet_name.trace_add('write', self._invalidate_gsheet_cache)
 
         # --- UI Elements ---
         # Style
@@ -72,6 +103,9 @@ class QRScannerApp:
         self.btn_save_excel = ttk.Button(excel_frame, text="Save to Excel", command=self.save_to_excel, state=tk.DISABLED)
         self.btn_save_excel.pack(pady=5, fill="x")
 
+        self.btn_export_excel = ttk.Button(excel_frame, text="Export Log to Excel", command=self.export_to_excel)
+        self.btn_export_excel.pack(pady=5, fill="x")
+
         # Frame for Google Sheets Options
         gsheet_frame = ttk.LabelFrame(root, text="Google Sheets Options", padding=10)
         gsheet_frame.pack(padx=10, pady=10, fill="x")
@@ -95,8 +129,13 @@ class QRScannerApp:
         # Webcam display area (optional, can be a separate window)
         self.webcam_window = None
         self.webcam_label = None
+        self.preview_imgtk = None # Single PhotoImage reused for every preview frame
+        self.latest_preview = None # Most recent frame (PIL image), drawn by _pump_preview
         self.cap = None
         self.stop_webcam_event = threading.Event()
+        # Size-1 queue: the capture thread drops stale frames so the decode
+        # worker always sees the most recent one.
+        self.decode_queue = queue.Queue(maxsize=1)
 
     def set_status(self, message):
         self.status_var.set(message)
@@ -124,12 +163,113 @@ class QRScannerApp:
             messagebox.showerror("Processing Error", f"Could not process QR content: {e}")
             return None
 
+    def _decode_qr(self, gray):
+        """
+        Decodes a QR code from a grayscale image (2D uint8 array).
+        Tries OpenCV's QRCodeDetector first (SIMD-optimized, cheap on misses)
+        and falls back to pyzbar only when OpenCV returns nothing.
+        Returns: decoded string or None
+        """
+        try:
+            data, points, _ = self.qr_detector.detectAndDecode(gray)
+        except cv2.error:
+            data = "" # Malformed frame; let pyzbar have a go
+        if data:
+            return data
+        decoded_objects = decode(gray)
+        if decoded_objects:
+            return decoded_objects[0].data.decode('utf-8')
+        return None
+
+    def _decode_with_enhancements(self, gray):
+        """
+        Multi-trial decode for still images: tries the raw image first, then
+        a series of enhancement passes (inversion, Otsu binarization, CLAHE,
+        upscaling, morphology), stopping at the first successful decode.
+        """
+        qr_content = self._decode_qr(gray)
+        if qr_content:
+            return qr_content
+
+        kernel = np.ones((3, 3), np.uint8)
+        transforms = (
+            lambda img: 255 - img, # Light-on-dark codes
+            lambda img: cv2.threshold(img, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)[1],
+            lambda img: cv2.createCLAHE(clipLimit=2.0).apply(img), # Low-contrast photos
+            lambda img: cv2.resize(img, (0, 0), fx=2, fy=2, interpolation=cv2.INTER_CUBIC),
+            lambda img: cv2.dilate(img, kernel), # Broken-up modules
+            lambda img: cv2.erode(img, kernel), # Bleeding ink
+        )
+        for transform in transforms:
+            qr_content = self._decode_qr(transform(gray))
+            if qr_content:
+                return qr_content
+        return None
+
+    MIN_ROI_AREA = 400 # Ignore candidate quads smaller than ~20x20 px
+    ROI_DECODE_SIZE = 200 # Candidate crops are normalized to this long side
+
+    def _candidate_regions(self, gray):
+        """
+        Cheap proposal stage: Otsu-binarize, find 4-sided contours, and return
+        padded crops around them. The expensive decoder then only has to scan
+        small patches instead of the whole frame.
+        """
+        _, bw = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        contours, _ = cv2.findContours(bw, cv2.RETR_LIST, cv2.CHAIN_APPROX_SIMPLE)
+        frame_h, frame_w = gray.shape[:2]
+        crops = []
+        for contour in contours:
+            if cv2.contourArea(contour) < self.MIN_ROI_AREA:
+                continue
+            peri = cv2.arcLength(contour, True)
+            approx = cv2.approxPolyDP(contour, 0.02 * peri, True)
+            if len(approx) != 4: # QR codes project to quadrilaterals
+                continue
+            x, y, w, h = cv2.boundingRect(approx)
+            # Pad by 1/8 so the quiet zone around the code survives the crop
+            x0 = max(x - w // 8, 0)
+            y0 = max(y - h // 8, 0)
+            x1 = min(x + w + w // 8, frame_w)
+            y1 = min(y + h + h // 8, frame_h)
+            crop = gray[y0:y1, x0:x1]
+            if min(crop.shape) < 10:
+                # Thin slivers (e.g. a 1 px-high edge contour) can't hold a QR
+                # code, and scaling them would produce a zero-sized dsize.
+                continue
+            scale = self.ROI_DECODE_SIZE / max(crop.shape)
+            new_w = max(int(crop.shape[1] * scale), 1)
+            new_h = max(int(crop.shape[0] * scale), 1)
+            crop = cv2.resize(crop, (new_w, new_h),
+                              interpolation=cv2.INTER_AREA if scale < 1 else cv2.INTER_CUBIC)
+            crops.append(crop)
+        return crops
+
+    FULL_FRAME_FALLBACK_EVERY = 3 # Full-frame decode cadence when ROI decodes keep missing
+
+    def _decode_frame(self, gray):
+        """Decodes a webcam frame: candidate crops first, falling back to the
+        full frame immediately when the proposal stage found nothing and on
+        every Nth miss otherwise — a persistent quad in the scene (monitor
+        bezel, sheet of paper) must not suppress full-frame decoding forever."""
+        candidates = self._candidate_regions(gray)
+        for crop in candidates:
+            qr_content = self._decode_qr(crop)
+            if qr_content:
+                return qr_content
+        self._frames_since_full_decode += 1
+        if not candidates or self._frames_since_full_decode >= self.FULL_FRAME_FALLBACK_EVERY:
+            self._frames_since_full_decode = 0
+            return self._decode_qr(gray)
+        return None
+
     def update_ui_with_scan(self, object_id, object_name, timestamp):
         self.scanned_data = {
             "Object ID": object_id,
             "Name": object_name,
             "Timestamp": timestamp
         }
+        self.scanned_row = (object_id, object_name, timestamp) # Ordered as HEADERS
         display_text = (f"Successfully Scanned!\n"
                         f"ID: {object_id}\n"
                         f"Name: {object_name}\n"
@@ -144,79 +284,175 @@ class QRScannerApp:
 
     def start_webcam_scan_thread(self):
         self.stop_webcam_event.clear()
+        # Fresh queue per session: a frame left over from a stopped session
+        # must not be decoded (and reported) by the new worker.
+        self.decode_queue = queue.Queue(maxsize=1)
         self.set_status("Starting webcam...")
         # Disable button to prevent multiple threads
         self.btn_scan_webcam.config(state=tk.DISABLED)
-        threading.Thread(target=self.scan_from_webcam, daemon=True).start()
-
-    def scan_from_webcam(self):
-        self.cap = cv2.VideoCapture(0)
-        if not self.cap.isOpened():
-            self.set_status("Error: Cannot open webcam.")
-            messagebox.showerror("Webcam Error", "Could not open webcam. Is it connected and not in use?")
-            self.btn_scan_webcam.config(state=tk.NORMAL) # Re-enable button
-            return
-
-        # Create a Toplevel window for the webcam feed
+        # Create the preview window here, on the main thread; the capture
+        # thread only grabs frames and never touches Tk widgets.
         if self.webcam_window is None or not self.webcam_window.winfo_exists():
             self.webcam_window = tk.Toplevel(self.root)
-            self.webcam_window.title("Webcam Feed (Press 'Q' to close)")
+            self.webcam_window.title("Webcam Feed")
             self.webcam_label = ttk.Label(self.webcam_window)
             self.webcam_label.pack()
             self.webcam_window.protocol("WM_DELETE_WINDOW", self.stop_webcam_feed) # Handle window close
-        
-        self.set_status("Webcam active. Looking for QR code...")
+        threading.Thread(target=self.scan_from_webcam, daemon=True).start()
+
+    DECODE_MAX_WIDTH = 640 # Decode on a downscaled copy; zbar cost scales with pixel count
+    FRAME_INTERVAL = 1 / 30 # Capture loop pacing; no point grabbing faster than the preview draws
+
+    def scan_from_webcam(self):
+        # Work on a local handle: stop_webcam_feed (main thread) clears
+        # self.cap during teardown, and hitting None.read() mid-loop would
+        # raise a spurious error dialog on a normal window close.
+        cap = self.cap = cv2.VideoCapture(0)
+        # Ask the camera for a modest resolution up front so we don't pay for
+        # pixels we would only throw away before decoding.
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.DECODE_MAX_WIDTH)
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+        if not cap.isOpened():
+            self.root.after(0, self._report_webcam_open_failure)
+            return
+
+        self.root.after(0, self.set_status, "Webcam active. Looking for QR code...")
+
+        # Decode runs on its own thread so the preview isn't gated by decode latency.
+        threading.Thread(target=self._decode_worker, daemon=True).start()
+        # All Tk drawing happens on the main thread via this self-rearming pump.
+        self.root.after(0, self._pump_preview)
 
         try:
+            frame_count = 0
             while not self.stop_webcam_event.is_set():
-                ret, frame = self.cap.read()
+                next_frame_time = time.monotonic() + self.FRAME_INTERVAL
+                ret, frame = cap.read()
                 if not ret:
-                    self.set_status("Error: Failed to capture frame from webcam.")
+                    self.root.after(0, self.set_status, "Error: Failed to capture frame from webcam.")
                     break
-                
-                # Convert frame to RGB for Pillow and then Tkinter
-                cv2image = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                img = Image.fromarray(cv2image)
-                imgtk = ImageTk.PhotoImage(image=img)
-                
-                if self.webcam_label and self.webcam_label.winfo_exists():
-                    self.webcam_label.imgtk = imgtk # Keep a reference
-                    self.webcam_label.configure(image=imgtk)
-                    self.webcam_window.update_idletasks() # Force UI update
-
-                decoded_objects = decode(frame)
-                if decoded_objects:
-                    qr_content = decoded_objects[0].data.decode('utf-8')
-                    self.set_status(f"QR Detected: {qr_content}")
-                    
-                    processed_data = self._process_qr_content(qr_content)
-                    if processed_data:
-                        object_id, object_name, timestamp = processed_data
-                        self.root.after(0, lambda: self.update_ui_with_scan(object_id, object_name, timestamp))
-                        self.stop_webcam_feed() # Stop after successful scan
-                        break 
-                
-                # Allow Tkinter to process events and check for 'q' key press in console
-                # cv2.imshow alternative is handled by Tkinter window
-                if cv2.waitKey(1) & 0xFF == ord('q'): # For console-based stop if needed
-                     self.stop_webcam_event.set()
+                frame_count += 1
+
+                # Convert frame to RGB for Pillow only on every 2nd frame; the
+                # preview doesn't need the full capture rate, and cvtColor walks
+                # the whole pixel buffer. The Tk widgets themselves are only
+                # touched by _pump_preview on the main thread.
+                if frame_count % 2 == 0:
+                    cv2image = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                    self.latest_preview = Image.fromarray(cv2image)
+
+                # Decode on a grayscale, downscaled copy; keep `frame` full-size
+                # only for the Tk preview.
+                h, w = frame.shape[:2]
+                if w > self.DECODE_MAX_WIDTH:
+                    small = cv2.resize(frame, (self.DECODE_MAX_WIDTH, int(self.DECODE_MAX_WIDTH * h / w)),
+                                       interpolation=cv2.INTER_AREA)
+                else:
+                    small = frame
+                gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+                try:
+                    self.decode_queue.put_nowait(gray)
+                except queue.Full:
+                    pass # Worker is busy; drop the stale frame
+
+                # Pace the loop to ~30 FPS; waiting on the stop event means a
+                # shutdown request interrupts the sleep immediately.
+                sleep_time = next_frame_time - time.monotonic()
+                if sleep_time > 0:
+                    self.stop_webcam_event.wait(sleep_time)
 
         except Exception as e:
-            self.set_status(f"Webcam scanning error: {e}")
-            messagebox.showerror("Webcam Error", f"An error occurred during webcam scanning: {e}")
+            self.root.after(0, self._report_webcam_error, e)
         finally:
-            self.stop_webcam_feed()
-            self.btn_scan_webcam.config(state=tk.NORMAL) # Re-enable button
+            # Teardown touches Tk widgets (preview window, status bar, button),
+            # so it runs on the main thread like the preview pump.
+            self.stop_webcam_event.set()
+            self.root.after(0, self._finish_webcam_session)
+
+    def _report_webcam_open_failure(self):
+        """Runs on the Tk main thread: reports that the webcam couldn't open."""
+        self.stop_webcam_feed() # Close the preview window created at session start
+        self.set_status("Error: Cannot open webcam.")
+        messagebox.showerror("Webcam Error", "Could not open webcam. Is it connected and not in use?")
+        self.btn_scan_webcam.config(state=tk.NORMAL) # Re-enable button
+
+    def _report_webcam_error(self, error):
+        """Runs on the Tk main thread: reports a capture-loop failure."""
+        self.set_status(f"Webcam scanning error: {error}")
+        messagebox.showerror("Webcam Error", f"An error occurred during webcam scanning: {error}")
+
+    def _finish_webcam_session(self):
+        """Runs on the Tk main thread: tears down the preview and re-enables
+        the scan button once the capture loop has exited."""
+        self.stop_webcam_feed()
+        self.btn_scan_webcam.config(state=tk.NORMAL) # Re-enable button
+
+    def _pump_preview(self):
+        """Runs on the Tk main thread: draws the most recent webcam frame and
+        re-arms itself (~30 FPS) until the webcam stops."""
+        if self.stop_webcam_event.is_set():
+            return
+        img = self.latest_preview
+        if img is not None and self.webcam_label and self.webcam_label.winfo_exists():
+            if self.preview_imgtk is None:
+                # Allocate the PhotoImage once; subsequent frames are
+                # pasted into it in place, avoiding per-frame allocation.
+                self.preview_imgtk = ImageTk.PhotoImage(image=img)
+                self.webcam_label.configure(image=self.preview_imgtk)
+            else:
+                self.preview_imgtk.paste(img)
+        self.root.after(33, self._pump_preview)
+
+    def _decode_worker(self):
+        """Pulls the latest frame off the queue and decodes it. Runs until a
+        QR code is found or the webcam is stopped."""
+        while not self.stop_webcam_event.is_set():
+            try:
+                gray = self.decode_queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            try:
+                qr_content = self._decode_frame(gray)
+            except Exception as e:
+                # One bad frame must not kill the decode thread; the next
+                # frame gets a fresh attempt.
+                print(f"Decode error on frame (skipped): {e}")
+                continue
+            if qr_content:
+                # Stop the session and hand the payload to the main thread:
+                # parsing pops dialogs and sets the status bar, both Tk, and
+                # stopping first means a malformed code in view produces one
+                # dialog instead of one per frame.
+                self.stop_webcam_event.set()
+                self.root.after(0, self._handle_decode_result, qr_content)
+                break
+
+    def _handle_decode_result(self, qr_content):
+        """Runs on the Tk main thread: parses the decoded payload and either
+        updates the UI or shows the format-error dialog."""
+        self.set_status(f"QR Detected: {qr_content}")
+        processed_data = self._process_qr_content(qr_content)
+        if processed_data:
+            self.update_ui_with_scan(*processed_data)
 
     def stop_webcam_feed(self):
+        # Set the event before touching the capture so an in-flight
+        # cap.read() on the worker thread returns promptly.
         self.stop_webcam_event.set()
-        if self.cap:
-            self.cap.release()
-            self.cap = None
+        cap, self.cap = self.cap, None # Clear unconditionally; on_closing calls this too
+        if cap:
+            try:
+                cap.release()
+            except Exception as e:
+                self.set_status(f"Warning: webcam release failed: {e}")
         if self.webcam_window and self.webcam_window.winfo_exists():
             self.webcam_window.destroy()
             self.webcam_window = None
-        cv2.destroyAllWindows() # Ensure all OpenCV windows are closed
+        self.preview_imgtk = None # Frame size may change on the next session
+        self.latest_preview = None
+        # No cv2.destroyAllWindows() here: the preview lives in a Tk Toplevel,
+        # and initializing HighGUI just to tear it down is wasted work (and a
+        # crash vector when mixed with Tk).
         self.set_status("Webcam stopped.")
 
 
@@ -230,11 +466,14 @@ class QRScannerApp:
             return
 
         try:
-            img = Image.open(file_path)
-            decoded_objects = decode(img)
-
-            if decoded_objects:
-                qr_content = decoded_objects[0].data.decode('utf-8')
+            gray = cv2.imread(file_path, cv2.IMREAD_GRAYSCALE)
+            if gray is None:
+                # OpenCV can't decode every format (e.g. GIF); fall back to PIL
+                # and convert to the same single-channel uint8 layout.
+                gray = np.asarray(Image.open(file_path).convert('L'))
+            qr_content = self._decode_with_enhancements(gray)
+
+            if qr_content:
                 self.set_status(f"QR Detected in file: {qr_content}")
                 processed_data = self._process_qr_content(qr_content)
                 if processed_data:
@@ -245,6 +484,7 @@ class QRScannerApp:
                 messagebox.showinfo("Scan Result", f"No QR code found in the selected image: {os.path.basename(file_path)}.")
                 self.lbl_qr_result.config(text="No QR code found in image.")
                 self.scanned_data = None
+                self.scanned_row = None
                 self.btn_save_excel.config(state=tk.DISABLED)
                 self.btn_save_gsheet.config(state=tk.DISABLED)
 
@@ -261,41 +501,103 @@ class QRScannerApp:
             title="Save Excel File As"
         )
         if file_path:
+            self._save_excel_workbook() # Persist anything pending to the old path
+            self._excel_workbook = None # Next save reloads from the new location
             self.excel_file_path = file_path
             self.lbl_excel_path.config(text=f"Excel Path: {self.excel_file_path}")
             self.set_status(f"Excel save path set to: {self.excel_file_path}")
         else:
             self.set_status("Excel path selection cancelled.")
 
-    def _get_excel_headers(self):
-        return ["Object ID", "Name", "Timestamp"]
+    def _get_csv_log_path(self):
+        # The CSV log lives next to the chosen Excel file and is the true,
+        # append-only record of every scan.
+        return os.path.splitext(self.excel_file_path)[0] + ".csv"
+
+    def _append_to_csv_log(self, row_data):
+        csv_path = self._get_csv_log_path()
+        write_headers = not os.path.exists(csv_path) or os.path.getsize(csv_path) == 0
+        with open(csv_path, 'a', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            if write_headers:
+                writer.writerow(self.HEADERS)
+            writer.writerow(row_data)
+
+    def export_to_excel(self):
+        """Materializes the full CSV scan log into the Excel file in one pass."""
+        csv_path = self._get_csv_log_path()
+        if not os.path.exists(csv_path):
+            messagebox.showwarning("No Log", "No scan log found to export yet.")
+            return
+
+        try:
+            openpyxl = _get_openpyxl()
+            # Write-only mode streams rows out instead of building the whole
+            # sheet in memory, which matters once the log gets long.
+            workbook = openpyxl.Workbook(write_only=True)
+            sheet = workbook.create_sheet()
+            with open(csv_path, newline='', encoding='utf-8') as f:
+                for row in csv.reader(f):
+                    sheet.append(row)
+            workbook.save(self.excel_file_path)
+            self._excel_workbook = None # On-disk file was rebuilt; drop the stale handle
+            self.set_status(f"Log exported to Excel: {self.excel_file_path}")
+            messagebox.showinfo("Excel Export", f"Scan log successfully exported to\n{self.excel_file_path}")
+        except PermissionError:
+            self.set_status(f"Error: Permission denied for {self.excel_file_path}. Is the file open?")
+            messagebox.showerror("Excel Error", f"Permission denied. Please close the Excel file if it's open and try again.\nPath: {self.excel_file_path}")
+        except Exception as e:
+            self.set_status(f"Error exporting to Excel: {e}")
+            messagebox.showerror("Excel Error", f"Could not export to Excel: {e}")
 
     def save_to_excel(self):
         if not self.scanned_data:
             messagebox.showwarning("No Data", "No data has been scanned yet.")
             return
 
-        headers = self._get_excel_headers()
-        row_data = [self.scanned_data[h] for h in headers] # Ensure correct order
+        headers = list(self.HEADERS)
+        row_data = list(self.scanned_row) # Already in HEADERS order
 
         try:
+            # The CSV log is the cheap, append-only record; the xlsx below is
+            # kept current for users who open it directly.
+            self._append_to_csv_log(row_data)
+
+            workbook = self._get_excel_workbook(headers)
+            workbook.active.append(row_data)
+            if not self.excel_save_scheduled:
+                self.excel_save_scheduled = True
+                self.root.after(EXCEL_SAVE_DELAY_MS, self._save_excel_workbook)
+            self.set_status(f"Scan logged; Excel save pending: {self.excel_file_path}")
+
+        except PermissionError:
+            self.set_status(f"Error: Permission denied for {self.excel_file_path}. Is the file open?")
+            messagebox.showerror("Excel Error", f"Permission denied. Please close the Excel file if it's open and try again.\nPath: {self.excel_file_path}")
+        except Exception as e:
+            self.set_status(f"Error saving to Excel: {e}")
+            messagebox.showerror("Excel Error", f"Could not save to Excel: {e}")
+
+    def _get_excel_workbook(self, headers):
+        """Loads (or creates) the workbook once and keeps it open; each scan
+        then appends in memory instead of re-parsing the whole file."""
+        if self._excel_workbook is None:
+            openpyxl = _get_openpyxl()
             if os.path.exists(self.excel_file_path):
-                workbook = openpyxl.load_workbook(self.excel_file_path)
-                sheet = workbook.active
-                # Optional: Check if headers match if file already exists
-                # current_headers = [cell.value for cell in sheet[1]]
-                # if current_headers != headers:
-                #     messagebox.askyesno("Header Mismatch", "Excel headers differ. Overwrite headers?")
+                self._excel_workbook = openpyxl.load_workbook(self.excel_file_path)
             else:
-                workbook = openpyxl.Workbook()
-                sheet = workbook.active
-                sheet.append(headers)
-
-            sheet.append(row_data)
-            workbook.save(self.excel_file_path)
+                self._excel_workbook = openpyxl.Workbook()
+                self._excel_workbook.active.append(headers)
+        return self._excel_workbook
+
+    def _save_excel_workbook(self):
+        """Writes the cached workbook to disk. Runs debounced after scans and
+        once more on shutdown/path changes."""
+        self.excel_save_scheduled = False
+        if self._excel_workbook is None:
+            return
+        try:
+            self._excel_workbook.save(self.excel_file_path)
             self.set_status(f"Data saved to Excel: {self.excel_file_path}")
-            messagebox.showinfo("Excel Save", f"Data successfully saved to\n{self.excel_file_path}")
-
         except PermissionError:
             self.set_status(f"Error: Permission denied for {self.excel_file_path}. Is the file open?")
             messagebox.showerror("Excel Error", f"Permission denied. Please close the Excel file if it's open and try again.\nPath: {self.excel_file_path}")
@@ -305,6 +607,12 @@ class QRScannerApp:
 
 
     def authenticate_gsheets(self):
+        # The Google auth stack is only needed here, and only once per run.
+        from google.oauth2.credentials import Credentials
+        from google_auth_oauthlib.flow import InstalledAppFlow
+        from google.auth.transport.requests import AuthorizedSession, Request
+        gspread = _get_gspread()
+
         creds = None
         self.set_status("Authenticating Google Sheets...")
         if not os.path.exists(GSHEET_CREDENTIALS_FILE):
@@ -351,7 +659,13 @@ class QRScannerApp:
                 with open(GSHEET_TOKEN_FILE, 'w') as token_file:
                     token_file.write(creds.to_json())
             
-            self.gspread_client = gspread.authorize(creds)
+            # One AuthorizedSession for the app's lifetime: the underlying
+            # requests pool keeps the TLS connection warm, so each Sheets call
+            # skips the TCP+TLS handshake.
+            session = AuthorizedSession(creds)
+            session.headers['User-Agent'] = APP_NAME
+            self.gspread_client = gspread.Client(auth=creds, session=session)
+            self._gsheet_worksheet = None # Handle belongs to the old client
             self.set_status("Google Sheets authenticated successfully.")
             messagebox.showinfo("Google Auth", "Successfully authenticated with Google Sheets.")
             if self.scanned_data: # Enable save button if data is present
@@ -388,63 +702,100 @@ class QRScannerApp:
             self.set_status("Error: Google Sheet name is empty.")
             return
 
-        headers = self._get_excel_headers() # Same headers
-        row_data = [self.scanned_data[h] for h in headers]
+        row_data = list(self.scanned_row) # Same column order as Excel
+
+        # Buffer the row and push the whole batch in one API call shortly after,
+        # instead of paying 3 HTTP roundtrips per scan.
+        self.pending_gsheet_rows.append(row_data)
+        if not self.gsheet_flush_scheduled:
+            self.gsheet_flush_scheduled = True
+            self.root.after(GSHEET_FLUSH_DELAY_MS, self._flush_gsheet_rows)
+        self.set_status(f"Scan queued for Google Sheets ({len(self.pending_gsheet_rows)} pending).")
+
+    def _invalidate_gsheet_cache(self, *args):
+        # The sheet name changed; the next flush must re-resolve the worksheet.
+        self._gsheet_worksheet = None
+
+    def _get_gsheet_worksheet(self):
+        """
+        Resolves (and caches) the target worksheet, creating the spreadsheet,
+        worksheet and header row as needed. Only the first call per sheet name
+        pays the API roundtrips; later saves reuse the handle.
+        """
+        if self._gsheet_worksheet is not None:
+            return self._gsheet_worksheet
+
+        gspread = _get_gspread()
+        sheet_name_to_use = self.gspread_sheet_name.get()
+        headers = list(self.HEADERS) # row_values returns a list, so compare as one
 
+        self.set_status(f"Accessing Google Sheet: {sheet_name_to_use}...")
+        # Try to open the spreadsheet by name
         try:
-            self.set_status(f"Accessing Google Sheet: {sheet_name_to_use}...")
-            # Try to open the spreadsheet by name
-            try:
-                spreadsheet = self.gspread_client.open(sheet_name_to_use)
-            except gspread.exceptions.SpreadsheetNotFound:
-                self.set_status(f"Spreadsheet '{sheet_name_to_use}' not found. Creating it...")
-                spreadsheet = self.gspread_client.create(sheet_name_to_use)
-                # Share it with yourself if you created it via API and want to open in browser easily
-                # Or if using service account, share with user's email
-                # spreadsheet.share('your-email@example.com', perm_type='user', role='writer')
-                self.set_status(f"Created and opened spreadsheet: {sheet_name_to_use}")
+            spreadsheet = self.gspread_client.open(sheet_name_to_use)
+        except gspread.exceptions.SpreadsheetNotFound:
+            self.set_status(f"Spreadsheet '{sheet_name_to_use}' not found. Creating it...")
+            spreadsheet = self.gspread_client.create(sheet_name_to_use)
+            # Share it with yourself if you created it via API and want to open in browser easily
+            # Or if using service account, share with user's email
+            # spreadsheet.share('your-email@example.com', perm_type='user', role='writer')
+            self.set_status(f"Created and opened spreadsheet: {sheet_name_to_use}")
+
+        # Try to get the first worksheet, or create one named 'Sheet1'
+        try:
+            worksheet = spreadsheet.sheet1 # Default first sheet
+        except gspread.exceptions.WorksheetNotFound:
+            self.set_status(f"Worksheet 'Sheet1' not found in '{sheet_name_to_use}'. Creating it...")
+            worksheet = spreadsheet.add_worksheet(title="Sheet1", rows="100", cols="20") # Create with a default size
+            self.set_status(f"Created worksheet 'Sheet1' in '{sheet_name_to_use}'.")
+
+        # Check if headers exist (done once; the answer doesn't change between scans)
+        existing_headers = []
+        try:
+            first_row = worksheet.row_values(1)
+            if first_row:
+                existing_headers = first_row
+        except Exception as e: # Handles empty sheet or other gspread errors
+            self.set_status(f"Could not read headers from sheet (may be empty): {e}")
+
+        if not existing_headers or existing_headers != headers:
+            # If sheet is completely empty (no first row) or headers don't match
+            if not existing_headers: # Sheet is empty
+                worksheet.insert_row(headers, 1) # Insert headers at the first row
+                self.set_status("Added headers to new Google Sheet.")
+            elif existing_headers != headers and all(h == '' for h in existing_headers): # First row is empty but exists
+                worksheet.update('A1', [headers]) # Update the first row with headers
+                self.set_status("Added headers to empty first row of Google Sheet.")
+            # else:
+                # Headers exist but are different. Decide on a strategy:
+                # 1. Append anyway (might mess up columns)
+                # 2. Warn user
+                # 3. Create new sheet
+                # For now, we'll just append. A more robust solution would ask the user.
+                # self.set_status("Warning: Headers in Google Sheet do not match. Appending data anyway.")
+
+        self._gsheet_worksheet = worksheet
+        return worksheet
+
+    def _flush_gsheet_rows(self):
+        """Pushes all buffered rows to Google Sheets in a single batched append."""
+        self.gsheet_flush_scheduled = False
+        if not self.pending_gsheet_rows or not self.gspread_client:
+            return
 
+        gspread = _get_gspread() # Needed for the exception types below
+        sheet_name_to_use = self.gspread_sheet_name.get()
 
-            # Try to get the first worksheet, or create one named 'Sheet1'
-            try:
-                worksheet = spreadsheet.sheet1 # Default first sheet
-            except gspread.exceptions.WorksheetNotFound:
-                self.set_status(f"Worksheet 'Sheet1' not found in '{sheet_name_to_use}'. Creating it...")
-                worksheet = spreadsheet.add_worksheet(title="Sheet1", rows="100", cols="20") # Create with a default size
-                self.set_status(f"Created worksheet 'Sheet1' in '{sheet_name_to_use}'.")
-            
-            # Check if headers exist
-            # Using pandas to read the first row for simplicity, then gspread for writing
-            # This avoids gspread rate limits if sheet is very large and we only need headers
-            existing_headers = []
-            try:
-                # Get all values, which can be slow for large sheets.
-                # A more optimized way is to get just the first row.
-                first_row = worksheet.row_values(1)
-                if first_row:
-                    existing_headers = first_row
-            except Exception as e: # Handles empty sheet or other gspread errors
-                self.set_status(f"Could not read headers from sheet (may be empty): {e}")
-
-            if not existing_headers or existing_headers != headers:
-                # If sheet is completely empty (no first row) or headers don't match
-                if not existing_headers: # Sheet is empty
-                    worksheet.insert_row(headers, 1) # Insert headers at the first row
-                    self.set_status("Added headers to new Google Sheet.")
-                elif existing_headers != headers and all(h == '' for h in existing_headers): # First row is empty but exists
-                    worksheet.update('A1', [headers]) # Update the first row with headers
-                    self.set_status("Added headers to empty first row of Google Sheet.")
-                # else:
-                    # Headers exist but are different. Decide on a strategy:
-                    # 1. Append anyway (might mess up columns)
-                    # 2. Warn user
-                    # 3. Create new sheet
-                    # For now, we'll just append. A more robust solution would ask the user.
-                    # self.set_status("Warning: Headers in Google Sheet do not match. Appending data anyway.")
-
-            worksheet.append_row(row_data)
-            self.set_status(f"Data saved to Google Sheet: {sheet_name_to_use} (Sheet1)")
-            messagebox.showinfo("Google Sheets Save", f"Data successfully saved to Google Sheet:\n'{sheet_name_to_use}' (Sheet1)")
+        try:
+            worksheet = self._get_gsheet_worksheet()
+            rows = self.pending_gsheet_rows
+            # One values.append call for the whole batch (gspread's batched
+            # counterpart to per-row append_row). The buffer is only cleared
+            # once the append succeeded, so a failed flush keeps the rows
+            # queued and the next flush (or a re-click) retries them.
+            worksheet.append_rows(rows, value_input_option='RAW')
+            self.pending_gsheet_rows = []
+            self.set_status(f"{len(rows)} row(s) saved to Google Sheet: {sheet_name_to_use} (Sheet1)")
 
         except gspread.exceptions.APIError as e:
             self.set_status(f"Google Sheets API Error: {e.response.json()['error']['message']}")
@@ -457,6 +808,10 @@ class QRScannerApp:
         """Handle window close event."""
         if self.cap:
             self.stop_webcam_feed()
+        if self.excel_save_scheduled:
+            self._save_excel_workbook() # Persist any appends the debounce hadn't flushed
+        if self.pending_gsheet_rows:
+            self._flush_gsheet_rows() # Don't lose buffered scans on exit
         self.root.destroy()
 
 